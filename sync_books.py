@@ -8,15 +8,44 @@ same book with 30-day date tolerance.
 """
 
 import argparse
+import bisect
 import csv
+import functools
+import io
+import os
 import re
 import sys
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # Optional: only needed for --fuzzy
+    fuzz = process = None
 
-@dataclass
+# Date formats to try for each export, most likely first
+GOODREADS_DATE_FORMATS = ['%Y/%m/%d', '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y']
+BOOKTRACKER_DATE_FORMATS = ['%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y', '%d/%m/%Y']
+
+# Read buffer for CSV exports, which can run to several megabytes
+CSV_BUFFER_SIZE = 1 << 20
+
+# Patterns used on every row, compiled once
+_ISBN_RE = re.compile(r'^="?([^"]*)"?$')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_SERIES_NUM_RE = re.compile(r'\s*\([^)]*#\d+[^)]*\)\s*$')
+_SERIES_WORD_RE = re.compile(r'\s*\([^)]*(?:series|saga|trilogy|book|volume|#)[^)]*\)\s*$', re.IGNORECASE)
+
+# Deletes every ASCII character _PUNCT_RE would remove, for the str.translate fast path
+_ASCII_PUNCT_TABLE = str.maketrans({
+    c: None for c in map(chr, range(128))
+    if not (c.isalnum() or c == '_' or c.isspace())
+})
+
+@dataclass(slots=True)
 class ReadInstance:
     """Represents a single read of a book."""
     title: str
@@ -25,7 +54,22 @@ class ReadInstance:
     isbn13: str
     read_date: datetime | None  # Primary date (end date or single date)
     start_date: datetime | None  # Start date if available
-    raw_data: dict  # Original row data for export
+    key: tuple[str, str, str, str, str] | None = None  # Cached get_book_key() result
+    start_ord: int | None = None  # Cached get_date_range() result, as date ordinals
+    end_ord: int | None = None
+
+
+def open_csv(filepath: Path) -> io.TextIOWrapper:
+    """Open a CSV export for reading through a large binary buffer."""
+    raw = open(filepath, 'rb', buffering=CSV_BUFFER_SIZE)
+    return io.TextIOWrapper(raw, encoding='utf-8', newline='', line_buffering=False)
+
+
+def get_column(row: list[str], index: int | None) -> str:
+    """Get a row value by column index, or an empty string if the column is missing."""
+    if index is None or index >= len(row):
+        return ""
+    return row[index]
 
 
 def parse_goodreads_isbn(value: str) -> str:
@@ -33,7 +77,7 @@ def parse_goodreads_isbn(value: str) -> str:
     if not value:
         return ""
     # Remove ="..." wrapper
-    match = re.match(r'^="?([^"]*)"?$', value)
+    match = _ISBN_RE.match(value)
     if match:
         return match.group(1).strip()
     return value.strip()
@@ -52,19 +96,50 @@ def parse_date(date_str: str, formats: list[str]) -> datetime | None:
     return None
 
 
+def detect_date_format(samples: Iterable[str], formats: list[str]) -> str | None:
+    """Return the first format that parses a non-empty sample, or None if none do."""
+    for sample in samples:
+        sample = sample.strip()
+        if not sample:
+            continue
+        for fmt in formats:
+            try:
+                datetime.strptime(sample, fmt)
+                return fmt
+            except ValueError:
+                continue
+    return None
+
+
+def order_date_formats(samples: Iterable[str], formats: list[str]) -> list[str]:
+    """Move the format detected from a column's values to the front of formats.
+    
+    A column almost always uses one format throughout, so trying it first means
+    most cells parse on the first attempt instead of failing through the others.
+    """
+    detected = detect_date_format(samples, formats)
+    if detected is None:
+        return formats
+    return [detected] + [fmt for fmt in formats if fmt != detected]
+
+
+@functools.lru_cache(maxsize=8192)
 def normalize_text(text: str) -> str:
     """Normalize text for comparison: lowercase, strip punctuation, collapse whitespace."""
     if not text:
         return ""
     # Lowercase
     text = text.lower()
-    # Remove punctuation
-    text = re.sub(r'[^\w\s]', '', text)
+    # Remove punctuation (translate is much cheaper than the regex for plain ASCII)
+    if text.isascii():
+        text = text.translate(_ASCII_PUNCT_TABLE)
+    else:
+        text = _PUNCT_RE.sub('', text)
     # Collapse whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    return " ".join(text.split())
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_title(title: str) -> str:
     """Normalize book title: strip subtitles, series info, then normalize text.
     
@@ -80,30 +155,44 @@ def normalize_title(title: str) -> str:
         title = title.split(':')[0]
     # Remove parenthetical series info like "(Red Rising Saga, #3)"
     # This pattern matches content in parentheses that looks like series info
-    title = re.sub(r'\s*\([^)]*#\d+[^)]*\)\s*$', '', title)
+    title = _SERIES_NUM_RE.sub('', title)
     # Also remove other trailing parenthetical content that might be series names
-    title = re.sub(r'\s*\([^)]*(?:series|saga|trilogy|book|volume|#)[^)]*\)\s*$', '', title, flags=re.IGNORECASE)
+    title = _SERIES_WORD_RE.sub('', title)
     return normalize_text(title)
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_author(author: str) -> str:
     """Normalize author name for comparison."""
     if not author:
         return ""
     # Handle "Lastname,Firstname" format from Book Tracker
-    if ',' in author and not ' ' in author.split(',')[0]:
-        parts = author.split(',')
-        if len(parts) == 2:
-            author = f"{parts[1].strip()} {parts[0].strip()}"
+    last, sep, first = author.partition(',')
+    if sep and ' ' not in last and ',' not in first:
+        author = f"{first.strip()} {last.strip()}"
     return normalize_text(author)
 
 
-def get_book_key(read: ReadInstance) -> tuple[str, str, str, str]:
-    """Get matching keys for a book: (isbn13, isbn10, title_author, normalized_title)."""
+def get_book_key(read: ReadInstance) -> tuple[str, str, str, str, str]:
+    """Get matching keys for a book: (isbn13, isbn10, title_author, normalized_title, normalized_author)."""
     norm_title = normalize_title(read.title)
     norm_author = normalize_author(read.author)
     title_author = f"{norm_title}|{norm_author}"
-    return (read.isbn13, read.isbn10, title_author, norm_title)
+    # Intern so identical keys share one object and index lookups compare by identity
+    return (
+        sys.intern(read.isbn13),
+        sys.intern(read.isbn10),
+        sys.intern(title_author),
+        sys.intern(norm_title),
+        sys.intern(norm_author),
+    )
+
+
+def get_date_range(read: ReadInstance) -> tuple[int | None, int | None]:
+    """Get a read's (start, end) date ordinals, falling back to whichever date is set."""
+    start = read.start_date or read.read_date
+    end = read.read_date or read.start_date
+    return (start.toordinal() if start else None, end.toordinal() if end else None)
 
 
 def dates_match(read1: ReadInstance, read2: ReadInstance, tolerance_days: int = 30) -> bool:
@@ -114,146 +203,262 @@ def dates_match(read1: ReadInstance, read2: ReadInstance, tolerance_days: int =
     - The dates are within tolerance of each other
     - One date falls within the other's reading period (start to end) plus tolerance
     """
-    # If both have no dates, consider it a match (rely on book identity)
-    if read1.read_date is None and read1.start_date is None and read2.read_date is None and read2.start_date is None:
+    # If either has no dates, consider it a match (rely on book identity)
+    if read1.start_ord is None or read2.start_ord is None:
         return True
     
-    # Get the date ranges for each read
-    # For read1: use start_date to read_date if available, otherwise just the available date
-    r1_start = read1.start_date or read1.read_date
-    r1_end = read1.read_date or read1.start_date
-    
-    r2_start = read2.start_date or read2.read_date
-    r2_end = read2.read_date or read2.start_date
-    
-    # If we still have no dates for either, consider it a match
-    if r1_start is None or r2_start is None:
-        return True
-    
-    # Expand ranges by tolerance
-    tolerance = timedelta(days=tolerance_days)
-    r1_start_expanded = r1_start - tolerance
-    r1_end_expanded = r1_end + tolerance
-    r2_start_expanded = r2_start - tolerance
-    r2_end_expanded = r2_end + tolerance
-    
-    # Check if the ranges overlap
+    # Check if the ranges, each expanded by tolerance on both sides, overlap
     # Ranges overlap if one starts before the other ends
-    return r1_start_expanded <= r2_end_expanded and r2_start_expanded <= r1_end_expanded
+    window = 2 * tolerance_days
+    return read1.start_ord - read2.end_ord <= window and read2.start_ord - read1.end_ord <= window
 
 
 def load_goodreads_csv(filepath: Path) -> list[ReadInstance]:
     """Load and parse Goodreads CSV export."""
     reads = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Only include books marked as "read"
-            if row.get('Exclusive Shelf', '').strip().lower() != 'read':
-                continue
-            
-            # Parse read date
-            read_date = parse_date(
-                row.get('Date Read', ''),
-                ['%Y/%m/%d', '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y']
-            )
-            
-            # Parse ISBNs
-            isbn10 = parse_goodreads_isbn(row.get('ISBN', ''))
-            isbn13 = parse_goodreads_isbn(row.get('ISBN13', ''))
-            
-            reads.append(ReadInstance(
-                title=row.get('Title', '').strip(),
-                author=row.get('Author', '').strip(),
-                isbn10=isbn10,
-                isbn13=isbn13,
-                read_date=read_date,
-                start_date=None,  # Goodreads only has one date
-                raw_data=row
-            ))
+    with open_csv(filepath) as f:
+        reader = csv.reader(f, dialect='excel')
+        # Look up column positions once instead of building a dict per row
+        columns = {name: i for i, name in enumerate(next(reader, []))}
+        shelf_col = columns.get('Exclusive Shelf')
+        date_read_col = columns.get('Date Read')
+        isbn10_col = columns.get('ISBN')
+        isbn13_col = columns.get('ISBN13')
+        title_col = columns.get('Title')
+        author_col = columns.get('Author')
+        # Only include books marked as "read"
+        rows = [row for row in reader if get_column(row, shelf_col).strip().lower() == 'read']
+    
+    date_formats = order_date_formats(
+        (get_column(row, date_read_col) for row in rows), GOODREADS_DATE_FORMATS
+    )
+    for row in rows:
+        # Parse read date
+        read_date = parse_date(get_column(row, date_read_col), date_formats)
+        
+        # Parse ISBNs
+        isbn10 = parse_goodreads_isbn(get_column(row, isbn10_col))
+        isbn13 = parse_goodreads_isbn(get_column(row, isbn13_col))
+        
+        read = ReadInstance(
+            title=get_column(row, title_col).strip(),
+            author=get_column(row, author_col).strip(),
+            isbn10=isbn10,
+            isbn13=isbn13,
+            read_date=read_date,
+            start_date=None  # Goodreads only has one date
+        )
+        read.key = get_book_key(read)
+        read.start_ord, read.end_ord = get_date_range(read)
+        reads.append(read)
     return reads
 
 
 def load_booktracker_csv(filepath: Path) -> list[ReadInstance]:
     """Load and parse Book Tracker CSV export."""
     reads = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f, delimiter=';')
-        for row in reader:
-            # Only include books marked as "read"
-            if row.get('readingStatus', '').strip().lower() != 'read':
-                continue
-            
-            # Parse read dates
-            date_formats = ['%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y', '%d/%m/%Y']
-            start_date = parse_date(row.get('startReading', ''), date_formats)
-            end_date = parse_date(row.get('endReading', ''), date_formats)
-            
-            # Get author (first author if multiple)
-            authors_str = row.get('authors', '')
-            # Authors are comma-separated as "Lastname,Firstname,Lastname2,Firstname2"
-            # Take the first author pair
-            author_parts = authors_str.split(',')
-            if len(author_parts) >= 2:
-                author = f"{author_parts[0]},{author_parts[1]}"
-            else:
-                author = authors_str
-            
-            reads.append(ReadInstance(
-                title=row.get('title', '').strip(),
-                author=author.strip(),
-                isbn10=row.get('isbn10', '').strip(),
-                isbn13=row.get('isbn13', '').strip(),
-                read_date=end_date,
-                start_date=start_date,
-                raw_data=row
-            ))
+    with open_csv(filepath) as f:
+        reader = csv.reader(f, dialect='excel', delimiter=';')
+        # Look up column positions once instead of building a dict per row
+        columns = {name: i for i, name in enumerate(next(reader, []))}
+        status_col = columns.get('readingStatus')
+        start_col = columns.get('startReading')
+        end_col = columns.get('endReading')
+        authors_col = columns.get('authors')
+        title_col = columns.get('title')
+        isbn10_col = columns.get('isbn10')
+        isbn13_col = columns.get('isbn13')
+        # Only include books marked as "read"
+        rows = [row for row in reader if get_column(row, status_col).strip().lower() == 'read']
+    
+    start_formats = order_date_formats(
+        (get_column(row, start_col) for row in rows), BOOKTRACKER_DATE_FORMATS
+    )
+    end_formats = order_date_formats(
+        (get_column(row, end_col) for row in rows), BOOKTRACKER_DATE_FORMATS
+    )
+    for row in rows:
+        # Parse read dates
+        start_date = parse_date(get_column(row, start_col), start_formats)
+        end_date = parse_date(get_column(row, end_col), end_formats)
+        
+        # Get author (first author if multiple)
+        authors_str = get_column(row, authors_col)
+        # Authors are comma-separated as "Lastname,Firstname,Lastname2,Firstname2"
+        # Take the first author pair
+        author_parts = authors_str.split(',')
+        if len(author_parts) >= 2:
+            author = f"{author_parts[0]},{author_parts[1]}"
+        else:
+            author = authors_str
+        
+        read = ReadInstance(
+            title=get_column(row, title_col).strip(),
+            author=author.strip(),
+            isbn10=get_column(row, isbn10_col).strip(),
+            isbn13=get_column(row, isbn13_col).strip(),
+            read_date=end_date,
+            start_date=start_date
+        )
+        read.key = get_book_key(read)
+        read.start_ord, read.end_ord = get_date_range(read)
+        reads.append(read)
     return reads
 
 
-def find_matching_read(read: ReadInstance, other_reads: list[ReadInstance]) -> ReadInstance | None:
-    """Find a matching read instance in another list."""
-    read_key = get_book_key(read)
+@dataclass
+class BookIndex:
+    """Inverted indices over a list of reads, keyed by each matching identifier."""
+    by_isbn13: dict[str, list[ReadInstance]] = field(default_factory=dict)
+    by_isbn10: dict[str, list[ReadInstance]] = field(default_factory=dict)
+    by_title_author: dict[str, list[ReadInstance]] = field(default_factory=dict)
+    by_author_title: dict[tuple[str, str], list[ReadInstance]] = field(default_factory=dict)
+    # Sorted, de-duplicated normalized titles per normalized author, for prefix matching
+    by_author: dict[str, list[str]] = field(default_factory=dict)
+
+
+def build_index(reads: list[ReadInstance]) -> BookIndex:
+    """Build inverted indices over reads using their precomputed book keys."""
+    index = BookIndex()
+    for read in reads:
+        isbn13, isbn10, title_author, norm_title, norm_author = read.key
+        if isbn13:
+            index.by_isbn13.setdefault(isbn13, []).append(read)
+        if isbn10:
+            index.by_isbn10.setdefault(isbn10, []).append(read)
+        if title_author:
+            index.by_title_author.setdefault(title_author, []).append(read)
+        if norm_title and norm_author:
+            index.by_author_title.setdefault((norm_author, norm_title), []).append(read)
+    for norm_author, norm_title in index.by_author_title:
+        index.by_author.setdefault(norm_author, []).append(norm_title)
+    for titles in index.by_author.values():
+        titles.sort()
+    return index
+
+
+def find_prefix_titles(titles: list[str], title: str) -> Iterator[str]:
+    """Yield titles from a sorted list that start with title or that title starts with."""
+    start = bisect.bisect_left(titles, title)
+    # Titles starting with this one sort contiguously from its insertion point
+    i = start
+    while i < len(titles) and titles[i].startswith(title):
+        yield titles[i]
+        i += 1
+    # Titles this one starts with sort before it; on a miss, jump back to the
+    # titles no greater than the common prefix, since only those can still match
+    end = start
+    while end:
+        other = titles[end - 1]
+        common = os.path.commonprefix([other, title])
+        if common == other:
+            yield other
+            end -= 1
+        elif common:
+            end = bisect.bisect_right(titles, common, 0, end - 1)
+        else:
+            break
+
+
+def find_matching_read(
+    read: ReadInstance, index: BookIndex, fuzzy_threshold: float | None = None
+) -> ReadInstance | None:
+    """Find a matching read instance in an indexed list.
     
-    for other in other_reads:
-        other_key = get_book_key(other)
-        
-        # Check if books match by any identifier
-        book_matches = False
-        
-        # Match by ISBN-13
-        if read_key[0] and other_key[0] and read_key[0] == other_key[0]:
-            book_matches = True
-        # Match by ISBN-10
-        elif read_key[1] and other_key[1] and read_key[1] == other_key[1]:
-            book_matches = True
-        # Match by title+author (exact match)
-        elif read_key[2] and other_key[2] and read_key[2] == other_key[2]:
-            book_matches = True
-        # Match by title prefix + same author (for cases like "Gironimo!" vs "Gironimo! Riding the...")
-        elif read_key[3] and other_key[3]:
-            read_author = normalize_author(read.author)
-            other_author = normalize_author(other.author)
-            if read_author and other_author and read_author == other_author:
-                # Check if one title starts with the other (prefix match)
-                if read_key[3].startswith(other_key[3]) or other_key[3].startswith(read_key[3]):
-                    book_matches = True
-        
-        if book_matches and dates_match(read, other):
-            return other
+    If fuzzy_threshold is set, titles by the same author scoring at least that
+    similarity (0-100) are also considered once all exact checks have failed.
+    """
+    # Fast path: ISBNs are conclusive, so try them before any title/author candidates
+    # Match by ISBN-13
+    if read.isbn13:
+        for other in index.by_isbn13.get(read.isbn13, ()):
+            if dates_match(read, other):
+                return other
+    # Match by ISBN-10
+    if read.isbn10:
+        for other in index.by_isbn10.get(read.isbn10, ()):
+            if dates_match(read, other):
+                return other
+    
+    read_key = read.key
+    
+    # Match by title+author (exact match)
+    if read_key[2]:
+        for other in index.by_title_author.get(read_key[2], ()):
+            if dates_match(read, other):
+                return other
+    # Match by title prefix + same author (for cases like "Gironimo!" vs "Gironimo! Riding the...")
+    read_author = read_key[4]
+    if read_key[3] and read_author:
+        for other_title in find_prefix_titles(index.by_author.get(read_author, []), read_key[3]):
+            for other in index.by_author_title[(read_author, other_title)]:
+                if dates_match(read, other):
+                    return other
+    # Match by similar title + same author (for typos like "Seperate" vs "Separate")
+    if fuzzy_threshold is not None and read_key[3] and read_author:
+        titles = index.by_author.get(read_author, [])
+        for other_title, _, _ in process.extract(
+            read_key[3], titles, scorer=fuzz.ratio, score_cutoff=fuzzy_threshold, limit=None
+        ):
+            for other in index.by_author_title[(read_author, other_title)]:
+                if dates_match(read, other):
+                    return other
     
     return None
 
 
-def find_missing_reads(source_reads: list[ReadInstance], target_reads: list[ReadInstance]) -> list[ReadInstance]:
-    """Find read instances in source that don't exist in target."""
+def find_missing_reads(
+    source_reads: list[ReadInstance],
+    target_index: BookIndex,
+    fuzzy_threshold: float | None = None,
+) -> list[ReadInstance]:
+    """Find read instances in source that don't exist in the indexed target."""
+    # A match depends only on the book key and date range, so duplicate rows
+    # (e.g. the same re-read exported twice) only need to be looked up once
+    seen: dict[tuple, ReadInstance | None] = {}
     missing = []
     for read in source_reads:
-        if find_matching_read(read, target_reads) is None:
+        lookup = (read.key, read.start_ord, read.end_ord)
+        if lookup not in seen:
+            seen[lookup] = find_matching_read(read, target_index, fuzzy_threshold)
+        if seen[lookup] is None:
             missing.append(read)
     return missing
 
 
+def goodreads_import_row(read: ReadInstance, date_added: str) -> tuple[str, ...]:
+    """Build a Goodreads import row, in write_goodreads_import's column order."""
+    # Format date for Goodreads
+    date_read = read.read_date.strftime('%Y/%m/%d') if read.read_date else ''
+    
+    # Format ISBNs in Goodreads style
+    isbn10 = f'="{read.isbn10}"' if read.isbn10 else '=""'
+    isbn13 = f'="{read.isbn13}"' if read.isbn13 else '=""'
+    
+    return (
+        read.title,  # Title
+        read.author.replace(',', ' ') if ',' in read.author else read.author,  # Author
+        isbn10,  # ISBN
+        isbn13,  # ISBN13
+        '0',  # My Rating
+        '',  # Average Rating
+        '',  # Publisher
+        '',  # Binding
+        '',  # Number of Pages
+        '',  # Year Published
+        '',  # Original Publication Year
+        date_read,  # Date Read
+        date_added,  # Date Added
+        '',  # Bookshelves
+        'read',  # Exclusive Shelf
+        '',  # My Review
+        '',  # Spoiler
+        '',  # Private Notes
+        '1',  # Read Count
+        '0',  # Owned Copies
+    )
+
+
 def write_goodreads_import(reads: list[ReadInstance], filepath: Path) -> None:
     """Write a CSV file formatted for Goodreads import."""
     if not reads:
@@ -267,46 +472,42 @@ def write_goodreads_import(reads: list[ReadInstance], filepath: Path) -> None:
         'Exclusive Shelf', 'My Review', 'Spoiler', 'Private Notes',
         'Read Count', 'Owned Copies'
     ]
+    date_added = datetime.now().strftime('%Y/%m/%d')
     
     with open(filepath, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for read in reads:
-            # Format date for Goodreads
-            date_read = read.read_date.strftime('%Y/%m/%d') if read.read_date else ''
-            
-            # Format ISBNs in Goodreads style
-            isbn10 = f'="{read.isbn10}"' if read.isbn10 else '=""'
-            isbn13 = f'="{read.isbn13}"' if read.isbn13 else '=""'
-            
-            row = {
-                'Title': read.title,
-                'Author': read.author.replace(',', ' ') if ',' in read.author else read.author,
-                'ISBN': isbn10,
-                'ISBN13': isbn13,
-                'My Rating': '0',
-                'Average Rating': '',
-                'Publisher': '',
-                'Binding': '',
-                'Number of Pages': '',
-                'Year Published': '',
-                'Original Publication Year': '',
-                'Date Read': date_read,
-                'Date Added': datetime.now().strftime('%Y/%m/%d'),
-                'Bookshelves': '',
-                'Exclusive Shelf': 'read',
-                'My Review': '',
-                'Spoiler': '',
-                'Private Notes': '',
-                'Read Count': '1',
-                'Owned Copies': '0'
-            }
-            writer.writerow(row)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(goodreads_import_row(read, date_added) for read in reads)
     
     print(f"Wrote {len(reads)} books to {filepath}")
 
 
+def booktracker_import_row(read: ReadInstance) -> tuple[str, ...]:
+    """Build a Book Tracker import row, in write_booktracker_import's column order."""
+    # Format date for Book Tracker
+    end_reading = read.read_date.strftime('%Y-%m-%d') if read.read_date else ''
+    
+    # Convert author to Book Tracker format (Lastname,Firstname)
+    author = read.author
+    if ' ' in author and ',' not in author:
+        # Convert "Firstname Lastname" to "Lastname,Firstname"
+        parts = author.rsplit(' ', 1)
+        if len(parts) == 2:
+            author = f"{parts[1]},{parts[0]}"
+    
+    return (
+        read.title,  # title
+        author,  # authors
+        read.isbn10,  # isbn10
+        read.isbn13,  # isbn13
+        'read',  # readingStatus
+        '',  # startReading
+        end_reading,  # endReading
+        '',  # userRating
+        '',  # pages
+    )
+
+
 def write_booktracker_import(reads: list[ReadInstance], filepath: Path) -> None:
     """Write a CSV file formatted for Book Tracker import."""
     if not reads:
@@ -319,33 +520,9 @@ def write_booktracker_import(reads: list[ReadInstance], filepath: Path) -> None:
     ]
     
     with open(filepath, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=';')
-        writer.writeheader()
-        
-        for read in reads:
-            # Format date for Book Tracker
-            end_reading = read.read_date.strftime('%Y-%m-%d') if read.read_date else ''
-            
-            # Convert author to Book Tracker format (Lastname,Firstname)
-            author = read.author
-            if ' ' in author and ',' not in author:
-                # Convert "Firstname Lastname" to "Lastname,Firstname"
-                parts = author.rsplit(' ', 1)
-                if len(parts) == 2:
-                    author = f"{parts[1]},{parts[0]}"
-            
-            row = {
-                'title': read.title,
-                'authors': author,
-                'isbn10': read.isbn10,
-                'isbn13': read.isbn13,
-                'readingStatus': 'read',
-                'startReading': '',
-                'endReading': end_reading,
-                'userRating': '',
-                'pages': ''
-            }
-            writer.writerow(row)
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(fieldnames)
+        writer.writerows(booktracker_import_row(read) for read in reads)
     
     print(f"Wrote {len(reads)} books to {filepath}")
 
@@ -385,6 +562,17 @@ This will generate:
         default=30,
         help='Date tolerance in days for matching reads (default: 30)'
     )
+    parser.add_argument(
+        '--fuzzy',
+        action='store_true',
+        help='Also match similar titles by the same author (requires rapidfuzz)'
+    )
+    parser.add_argument(
+        '--fuzzy-threshold',
+        type=float,
+        default=90,
+        help='Minimum title similarity score (0-100) for --fuzzy matches (default: 90)'
+    )
     
     args = parser.parse_args()
     
@@ -395,21 +583,32 @@ This will generate:
     if not args.goodreads_csv.exists():
         print(f"Error: Goodreads file not found: {args.goodreads_csv}", file=sys.stderr)
         sys.exit(1)
+    if args.fuzzy and process is None:
+        print("Error: --fuzzy requires rapidfuzz (pip install rapidfuzz)", file=sys.stderr)
+        sys.exit(1)
+    fuzzy_threshold = args.fuzzy_threshold if args.fuzzy else None
     
-    # Load data
-    print(f"Loading Book Tracker data from: {args.booktracker_csv}")
-    booktracker_reads = load_booktracker_csv(args.booktracker_csv)
-    print(f"  Found {len(booktracker_reads)} read books")
-    
-    print(f"Loading Goodreads data from: {args.goodreads_csv}")
-    goodreads_reads = load_goodreads_csv(args.goodreads_csv)
-    print(f"  Found {len(goodreads_reads)} read books")
+    # Load data (the two exports are independent, so read them concurrently)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        booktracker_future = executor.submit(load_booktracker_csv, args.booktracker_csv)
+        goodreads_future = executor.submit(load_goodreads_csv, args.goodreads_csv)
+        
+        print(f"Loading Book Tracker data from: {args.booktracker_csv}")
+        booktracker_reads = booktracker_future.result()
+        print(f"  Found {len(booktracker_reads)} read books")
+        
+        print(f"Loading Goodreads data from: {args.goodreads_csv}")
+        goodreads_reads = goodreads_future.result()
+        print(f"  Found {len(goodreads_reads)} read books")
     
     # Find missing books
     print(f"\nComparing libraries (using {args.tolerance_days}-day date tolerance)...")
     
-    missing_from_goodreads = find_missing_reads(booktracker_reads, goodreads_reads)
-    missing_from_booktracker = find_missing_reads(goodreads_reads, booktracker_reads)
+    booktracker_index = build_index(booktracker_reads)
+    goodreads_index = build_index(goodreads_reads)
+    
+    missing_from_goodreads = find_missing_reads(booktracker_reads, goodreads_index, fuzzy_threshold)
+    missing_from_booktracker = find_missing_reads(goodreads_reads, booktracker_index, fuzzy_threshold)
     
     print(f"  Books in Book Tracker missing from Goodreads: {len(missing_from_goodreads)}")
     print(f"  Books in Goodreads missing from Book Tracker: {len(missing_from_booktracker)}")